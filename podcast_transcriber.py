@@ -5,13 +5,26 @@ Download and transcribe podcasts from various platforms (Acast, etc.)
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import multiprocessing
+import os
 import sys
 import json
 import re
+import shutil
+import subprocess
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html.parser import HTMLParser
 
 # Try to import whisper - it's optional
 try:
@@ -20,134 +33,285 @@ try:
 except ImportError:
     WHISPER_AVAILABLE = False
 
+# tqdm ships with openai-whisper; fall back to a plain progress line without it
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
 
-def extract_apple_podcasts_audio_url(episode_url):
-    """
-    Extract audio URL from an Apple Podcasts episode page.
+# numpy ships with both Whisper backends and is only needed for transcription
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-    Args:
-        episode_url (str): Apple Podcasts episode URL
+# faster-whisper (CTranslate2) is an optional, faster backend
+try:
+    from faster_whisper import WhisperModel as _FWModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
 
-    Returns:
-        tuple: (audio_url, episode_title, show_title)
-    """
-    print(f"Fetching Apple Podcasts episode page...")
+# Whisper runs on CUDA when available, where FP16 inference is much faster
+try:
+    import torch
+    CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    torch = None
+    CUDA_AVAILABLE = False
 
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        response = requests.get(episode_url, headers=headers, timeout=30)
-        response.raise_for_status()
+# Request headers shared by page fetches and audio downloads
+_UA = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+_COMMON_HEADERS = {'User-Agent': _UA}
+_DOWNLOAD_HEADERS = {
+    **_COMMON_HEADERS,
+    'Accept': 'audio/webm,audio/ogg,audio/wav,audio/*;q=0.9,application/ogg;q=0.7,video/*;q=0.6,*/*;q=0.5',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
 
-        # Look for JSON-LD structured data
-        json_ld_pattern = r'<script type="application/ld\+json">(.*?)</script>'
-        json_ld_matches = re.findall(json_ld_pattern, response.text, re.DOTALL)
+# Shared HTTP session so page fetches and downloads reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.headers.update(_COMMON_HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
 
-        audio_url = None
-        episode_title = "Unknown Episode"
-        show_title = "Unknown Show"
+# Download read size and minimum seconds between progress updates
+DOWNLOAD_CHUNK_SIZE = 1 << 18
+PROGRESS_INTERVAL = 0.25
 
-        for json_str in json_ld_matches:
-            try:
-                data = json.loads(json_str)
+# Precompiled patterns for the HTML scraping path
+_AUDIO_URL_RE = re.compile(rb'https?://[^\s<>"]+\.(?:mp3|m4a)')
+_ACAST_URL_RE = re.compile(r'shows\.acast\.com/([a-f0-9]+)/([a-f0-9]+)')
 
-                # Check if it's a PodcastEpisode
-                if isinstance(data, dict) and data.get('@type') == 'PodcastEpisode':
-                    # Get episode title
-                    episode_title = data.get('name', episode_title)
+# Runs of anything other than word characters collapse to one dash in filenames
+_SAFE_FN_RE = re.compile(r'\W+')
 
-                    # Get audio URL - Apple Podcasts uses 'url' field for audio
-                    if 'url' in data:
-                        audio_url = data.get('url')
 
-                    # Also check associatedMedia
-                    if not audio_url and 'associatedMedia' in data:
-                        media = data['associatedMedia']
-                        if isinstance(media, dict):
-                            audio_url = media.get('contentUrl') or media.get('url')
+class _StopParsing(Exception):
+    """Raised by _AudioURLFinder to abort parsing once a match is found."""
 
-                    # Get show title
-                    if 'partOfSeries' in data:
-                        series = data['partOfSeries']
-                        if isinstance(series, dict):
-                            show_title = series.get('name', show_title)
 
-                    if audio_url:
-                        break
+class _AudioURLFinder(HTMLParser):
+    """Find the first audio URL from an allowed host in media/link/meta tags."""
 
-            except json.JSONDecodeError:
+    TAGS = frozenset({'source', 'audio', 'a', 'meta'})
+
+    def __init__(self, allowed_hosts):
+        super().__init__()
+        self.allowed_hosts = frozenset(allowed_hosts)
+        self.found = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in self.TAGS:
+            return
+
+        for attr, val in attrs:
+            if not val or not val.startswith(('http://', 'https://')):
                 continue
 
-        # Alternative: look for audio tags or media URLs in the HTML
-        if not audio_url:
-            # Try to find audio/MP3 URLs in the page
-            audio_pattern = r'https?://[^\s<>"]+\.(?:mp3|m4a)'
-            audio_matches = re.findall(audio_pattern, response.text)
-
-            if audio_matches:
-                # Filter for podcast hosting CDN URLs
-                for url in audio_matches:
-                    if any(host in url.lower() for host in ['ausha', 'acast', 'libsyn', 'buzzsprout', 'simplecast', 'megaphone']):
-                        audio_url = url
-                        break
+            # Ignore query strings when checking the file extension
+            path = val.split('?', 1)[0].lower()
+            if path.endswith(('.mp3', '.m4a')) and any(host in path for host in self.allowed_hosts):
+                self.found = val
+                raise _StopParsing
 
-                if not audio_url and audio_matches:
-                    audio_url = audio_matches[0]
 
-        if audio_url:
-            print(f"Found audio: {episode_title}")
-            print(f"Show: {show_title}")
-            return audio_url, episode_title, show_title
-        else:
-            raise Exception("Could not extract audio URL from Apple Podcasts page")
+class _JSONLDCollector(HTMLParser):
+    """Collect the contents of <script type="application/ld+json"> tags."""
+
+    def __init__(self):
+        super().__init__()
+        self.blobs = []
+        self._parts = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'script' and dict(attrs).get('type') == 'application/ld+json':
+            self._parts = []
+
+    def handle_data(self, data):
+        if self._parts is not None:
+            self._parts.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'script' and self._parts is not None:
+            self.blobs.append(''.join(self._parts))
+            self._parts = None
+
+
+def iter_json_ld(html, chunk_size=1 << 16):
+    """
+    Yield the raw JSON string of each JSON-LD script in the page, in order.
+
+    The page is fed to the parser in chunks so callers that stop iterating
+    early skip parsing the rest of the document.
+
+    Args:
+        html (str): Page HTML
+        chunk_size (int): Number of characters fed to the parser at a time
+
+    Yields:
+        str: JSON-LD script contents
+    """
+    collector = _JSONLDCollector()
+    for start in range(0, len(html), chunk_size):
+        collector.feed(html[start:start + chunk_size])
+        yield from collector.blobs
+        collector.blobs.clear()
+
+    collector.close()
+    yield from collector.blobs
 
-    except requests.RequestException as e:
-        raise Exception(f"Failed to fetch Apple Podcasts page: {e}")
 
+def find_audio_url_in_html(html, allowed_hosts):
+    """
+    Find the first audio URL served from one of allowed_hosts in the page markup.
+
+    Args:
+        html (str): Page HTML
+        allowed_hosts (Iterable[str]): Host substrings to accept
+
+    Returns:
+        str or None: Audio URL, or None if no tag references one
+    """
+    finder = _AudioURLFinder(allowed_hosts)
+    try:
+        finder.feed(html)
+        finder.close()
+    except _StopParsing:
+        pass
+    return finder.found
 
-def extract_acast_audio_url(episode_url):
+
+def construct_acast_audio_url(episode_url):
     """
-    Extract audio URL from an Acast episode page.
+    Construct the direct Acast audio URL from the IDs in an episode URL.
 
     Args:
         episode_url (str): Acast episode URL
 
+    Returns:
+        str or None: Direct audio URL, or None if the URL has no IDs
+    """
+    # URL format: https://shows.acast.com/{show_id}/{episode_id}
+    url_match = _ACAST_URL_RE.search(episode_url)
+    if not url_match:
+        return None
+
+    show_id, episode_id = url_match.groups()
+    print("Constructed direct audio URL from IDs")
+    return f"https://play.acast.com/s/{show_id}/{episode_id}.mp3"
+
+
+# Supported platforms, checked in order against the episode URL.
+#   hosts:          CDN host substrings accepted for audio found in the page
+#   episode_fields: PodcastEpisode fields that may hold the audio URL
+#   media_fields:   associatedMedia fields that may hold the audio URL
+#   fallback:       optional callable building an audio URL from the page URL
+PLATFORMS = {
+    'acast': {
+        'name': 'Acast',
+        'match': 'acast.com',
+        'hosts': frozenset({'acast', 'media'}),
+        'episode_fields': (),
+        'media_fields': ('contentUrl',),
+        'fallback': construct_acast_audio_url,
+    },
+    'apple': {
+        'name': 'Apple Podcasts',
+        'match': 'podcasts.apple.com',
+        'hosts': frozenset({'ausha', 'acast', 'libsyn', 'buzzsprout', 'simplecast', 'megaphone'}),
+        'episode_fields': ('url',),
+        'media_fields': ('contentUrl', 'url'),
+        'fallback': None,
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _cdn_audio_url_re(hosts):
+    """Compile a bytes pattern for audio URLs containing any of the given hosts."""
+    alternation = b'|'.join(re.escape(host.encode()) for host in sorted(hosts))
+    return re.compile(rb'https?://[^\s<>"]*?(?:' + alternation + rb')[^\s<>"]*?\.(?:mp3|m4a)', re.IGNORECASE)
+
+
+def detect_platform(url):
+    """Return the PLATFORMS entry matching a URL, or None if unsupported."""
+    for platform_cfg in PLATFORMS.values():
+        if platform_cfg['match'] in url:
+            return platform_cfg
+    return None
+
+
+def _first_value(mapping, fields):
+    """Return the first truthy value among fields in mapping, or None."""
+    for field in fields:
+        value = mapping.get(field)
+        if value:
+            return value
+    return None
+
+
+def _decode_page(response):
+    """
+    Decode a page body once, using the charset from the response headers.
+
+    response.text decodes the body again on every access and falls back to
+    (slow) charset detection when the server doesn't declare one.
+    """
+    try:
+        return response.content.decode(response.encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return response.content.decode('utf-8', errors='replace')
+
+
+def extract_audio_url(episode_url, platform_cfg, skip_metadata=False):
+    """
+    Extract audio URL from a podcast episode page.
+
+    Args:
+        episode_url (str): Episode page URL
+        platform_cfg (dict): Platform entry from PLATFORMS
+        skip_metadata (bool): Don't fetch the page when the audio URL can be
+            built from the episode URL alone (titles are then placeholders)
+
     Returns:
         tuple: (audio_url, episode_title, show_title)
     """
-    print(f"Fetching Acast episode page...")
+    platform_name = platform_cfg['name']
 
-    # Extract show and episode IDs from URL
-    # URL format: https://shows.acast.com/{show_id}/{episode_id}
-    url_pattern = r'shows\.acast\.com/([a-f0-9]+)/([a-f0-9]+)'
-    url_match = re.search(url_pattern, episode_url)
-
-    if url_match:
-        show_id = url_match.group(1)
-        episode_id = url_match.group(2)
-        # Construct direct audio URL
-        direct_audio_url = f"https://play.acast.com/s/{show_id}/{episode_id}.mp3"
-        print(f"Constructed direct audio URL from IDs")
-    else:
-        direct_audio_url = None
+    fallback = platform_cfg['fallback']
+    fallback_audio_url = fallback(episode_url) if fallback else None
+
+    # The page is only needed for titles, so skip fetching it if they're unused
+    if skip_metadata and fallback_audio_url:
+        print("Skipping episode page fetch")
+        episode_title = Path(urlparse(episode_url).path).name or "Unknown Episode"
+        return fallback_audio_url, episode_title, "Unknown Show"
+
+    print(f"Fetching {platform_name} episode page...")
 
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        response = requests.get(episode_url, headers=headers, timeout=30)
+        response = _SESSION.get(episode_url, timeout=30)
         response.raise_for_status()
 
-        # Look for JSON-LD structured data
-        json_ld_pattern = r'<script type="application/ld\+json">(.*?)</script>'
-        json_ld_matches = re.findall(json_ld_pattern, response.text, re.DOTALL)
+        html = _decode_page(response)
 
         audio_url = None
         episode_title = "Unknown Episode"
         show_title = "Unknown Show"
 
-        for json_str in json_ld_matches:
+        # Look for JSON-LD structured data
+        for json_str in iter_json_ld(html):
+            # Cheap substring test to skip decoding unrelated blocks
+            if '"PodcastEpisode"' not in json_str:
+                continue
+
             try:
                 data = json.loads(json_str)
 
@@ -156,17 +320,16 @@ def extract_acast_audio_url(episode_url):
                     # Get episode title
                     episode_title = data.get('name', episode_title)
 
-                    # Get audio URL from associatedMedia
-                    if 'associatedMedia' in data:
-                        media = data['associatedMedia']
-                        if isinstance(media, dict):
-                            audio_url = media.get('contentUrl')
+                    # Get audio URL from the episode itself, then associatedMedia
+                    audio_url = _first_value(data, platform_cfg['episode_fields'])
+                    media = data.get('associatedMedia')
+                    if not audio_url and isinstance(media, dict):
+                        audio_url = _first_value(media, platform_cfg['media_fields'])
 
                     # Get show title
-                    if 'partOfSeries' in data:
-                        series = data['partOfSeries']
-                        if isinstance(series, dict):
-                            show_title = series.get('name', show_title)
+                    series = data.get('partOfSeries')
+                    if isinstance(series, dict):
+                        show_title = series.get('name', show_title)
 
                     if audio_url:
                         break
@@ -176,23 +339,20 @@ def extract_acast_audio_url(episode_url):
 
         # Alternative: look for audio tags or media URLs in the HTML
         if not audio_url:
-            # Try to find audio/MP3 URLs in the page
-            audio_pattern = r'https?://[^\s<>"]+\.(?:mp3|m4a)'
-            audio_matches = re.findall(audio_pattern, response.text)
-
-            if audio_matches:
-                # Filter for Acast CDN URLs
-                for url in audio_matches:
-                    if 'acast' in url.lower() or 'media' in url.lower():
-                        audio_url = url
-                        break
+            audio_url = find_audio_url_in_html(html, platform_cfg['hosts'])
 
-                if not audio_url and audio_matches:
-                    audio_url = audio_matches[0]
+        # Last resort: scan the raw page bytes for audio URLs, preferring
+        # podcast hosting CDNs over any other audio URL
+        if not audio_url:
+            match = _cdn_audio_url_re(platform_cfg['hosts']).search(response.content)
+            if not match:
+                match = _AUDIO_URL_RE.search(response.content)
+            if match:
+                audio_url = match.group(0).decode('utf-8', 'replace')
 
         # Use constructed direct URL as last resort
-        if not audio_url and direct_audio_url:
-            audio_url = direct_audio_url
+        if not audio_url and fallback_audio_url:
+            audio_url = fallback_audio_url
             print("Using constructed audio URL")
 
         if audio_url:
@@ -200,20 +360,63 @@ def extract_acast_audio_url(episode_url):
             print(f"Show: {show_title}")
             return audio_url, episode_title, show_title
         else:
-            raise Exception("Could not extract audio URL from Acast page")
+            raise Exception(f"Could not extract audio URL from {platform_name} page")
 
     except requests.RequestException as e:
-        raise Exception(f"Failed to fetch Acast page: {e}")
+        raise Exception(f"Failed to fetch {platform_name} page: {e}")
+
+
+# Per-directory index of downloaded audio, used for conditional re-downloads
+CACHE_INDEX_NAME = '.cache.json'
+_CACHE_LOCK = threading.Lock()
+
+
+def _load_cache_index(output_dir):
+    """Load the audio cache index for a directory (empty if missing or corrupt)."""
+    try:
+        return json.loads((output_dir / CACHE_INDEX_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_cache_index(output_dir, audio_url, entry):
+    """Set (or remove, if entry is None) the cache entry for audio_url."""
+    with _CACHE_LOCK:
+        index = _load_cache_index(output_dir)
+        if entry is None:
+            if index.pop(audio_url, None) is None:
+                return
+        else:
+            index[audio_url] = entry
 
+        tmp_path = output_dir / (CACHE_INDEX_NAME + '.tmp')
+        tmp_path.write_text(json.dumps(index, indent=2), encoding='utf-8')
+        os.replace(tmp_path, output_dir / CACHE_INDEX_NAME)
 
-def download_audio(audio_url, output_dir, filename=None):
+
+def _cached_file_matches(path, entry):
+    """Check that a cached file is still the one recorded in its index entry."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime_ns')
+
+
+def download_audio(audio_url, output_dir, filename=None, show_progress=True):
     """
     Download audio file from URL.
 
+    If the same URL was downloaded into output_dir before and the file is
+    still there unmodified, a conditional request is sent and an unchanged
+    file is reused instead of being downloaded again. Files are only left
+    on disk for this with --keep-audio.
+
     Args:
         audio_url (str): Direct audio file URL
         output_dir (Path): Directory to save audio
         filename (str): Optional filename (will be derived from URL if not provided)
+        show_progress (bool): Print a progress line while downloading
 
     Returns:
         Path: Path to downloaded audio file
@@ -241,33 +444,83 @@ def download_audio(audio_url, output_dir, filename=None):
         elif 'ausha' in audio_url.lower():
             referer = 'https://podcasts.apple.com/'
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'audio/webm,audio/ogg,audio/wav,audio/*;q=0.9,application/ogg;q=0.7,video/*;q=0.6,*/*;q=0.5',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
+        headers = dict(_DOWNLOAD_HEADERS)
 
         # Add referer if we detected one
         if referer:
             headers['Referer'] = referer
 
-        response = requests.get(audio_url, stream=True, timeout=60, headers=headers, allow_redirects=True)
+        # Revalidate a previous download of this URL if it's still on disk
+        # and hasn't since been overwritten (e.g. by an episode with the same title)
+        cached = _load_cache_index(output_dir).get(audio_url)
+        if cached and _cached_file_matches(output_dir / cached['file'], cached):
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        else:
+            cached = None
+
+        response = _SESSION.get(audio_url, stream=True, timeout=60, headers=headers, allow_redirects=True)
         response.raise_for_status()
 
+        if cached and response.status_code == 304:
+            cached_file = output_dir / cached['file']
+            print(f"Audio unchanged since last download: {cached_file}")
+            return cached_file
+
+        # Forget the old entry so a failed download is never mistaken for a cached one
+        _update_cache_index(output_dir, audio_url, None)
+
         total_size = int(response.headers.get('content-length', 0))
 
-        with open(output_file, 'wb') as f:
-            if total_size:
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            # Preallocate the file so it's written into one contiguous extent
+            if total_size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(f.fileno(), 0, total_size)
+                except OSError:
+                    pass
+
+            if total_size and show_progress and TQDM_AVAILABLE:
+                with tqdm(total=total_size, unit='B', unit_scale=True, unit_divisor=1024, desc='Progress') as pbar:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        pbar.update(len(chunk))
+            elif total_size and show_progress:
                 downloaded = 0
-                for chunk in response.iter_content(chunk_size=8192):
+                total_mb = total_size / 1048576
+                last_print = 0.0
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
                     downloaded += len(chunk)
-                    percent = (downloaded / total_size) * 100
-                    print(f"\rProgress: {percent:.1f}% ({downloaded / 1024 / 1024:.1f}MB / {total_size / 1024 / 1024:.1f}MB)", end='', flush=True)
+
+                    # Throttle progress updates to a few per second
+                    now = time.monotonic()
+                    if now - last_print > PROGRESS_INTERVAL or downloaded >= total_size:
+                        last_print = now
+                        percent = (downloaded / total_size) * 100
+                        print(f"\rProgress: {percent:.1f}% ({downloaded / 1048576:.1f}MB / {total_mb:.1f}MB)", end='', flush=True)
                 print()
             else:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                # No progress to report, so let shutil copy the raw stream in C
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
+
+            # Drop any preallocated space the body didn't fill
+            f.truncate()
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            stat = output_file.stat()
+            _update_cache_index(output_dir, audio_url, {
+                'file': output_file.name,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'etag': etag,
+                'last_modified': last_modified,
+            })
 
         print(f"Audio downloaded: {output_file}")
         return output_file
@@ -276,7 +529,167 @@ def download_audio(audio_url, output_dir, filename=None):
         raise Exception(f"Failed to download audio: {e}")
 
 
-def transcribe_audio(audio_file, language='en', model_size='base'):
+# Both Whisper backends expect 16 kHz mono float32 samples
+SAMPLE_RATE = 16000
+
+
+def load_audio_16k(audio_file):
+    """
+    Decode an audio file to 16 kHz mono float32 samples with ffmpeg.
+
+    Decoding once up front lets either backend consume the array directly
+    instead of spawning its own ffmpeg process.
+
+    Args:
+        audio_file (Path): Path to audio file
+
+    Returns:
+        np.ndarray: Samples in [-1.0, 1.0)
+    """
+    cmd = [
+        'ffmpeg', '-nostdin', '-threads', '0',
+        '-i', str(audio_file),
+        '-f', 's16le', '-ac', '1', '-ar', str(SAMPLE_RATE),
+        '-'
+    ]
+
+    try:
+        proc = subprocess.run(cmd, capture_output=True, check=True)
+    except FileNotFoundError:
+        raise Exception("ffmpeg is not installed or not on PATH")
+    except subprocess.CalledProcessError as e:
+        raise Exception(f"Failed to decode audio: {e.stderr.decode(errors='replace')}")
+
+    return np.frombuffer(proc.stdout, np.int16).astype(np.float32) / 32768.0
+
+
+@functools.lru_cache(maxsize=2)
+def _get_whisper_model(model_size):
+    """
+    Load a Whisper model, reusing it across calls in the same process.
+
+    Models stay cached after use, so memory grows with each distinct
+    model size loaded (up to two are kept).
+    """
+    print("Loading Whisper model...")
+    return whisper.load_model(model_size)
+
+
+@functools.lru_cache(maxsize=2)
+def _get_faster_whisper_model(model_size, cpu_threads=0):
+    """Load a faster-whisper model with int8 weights, cached like _get_whisper_model."""
+    print("Loading faster-whisper model...")
+    compute_type = 'int8_float16' if CUDA_AVAILABLE else 'int8'
+    return _FWModel(model_size, device='auto', compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+# CPU threads per model, set in transcription worker processes (0 = library default)
+_CPU_THREADS = 0
+
+
+def _get_model(model_size, backend):
+    """Return the cached model for a backend, loading it on first use."""
+    if backend == 'faster-whisper':
+        return _get_faster_whisper_model(model_size, _CPU_THREADS)
+    return _get_whisper_model(model_size)
+
+
+def _run_model(model, audio, language, backend):
+    """Transcribe decoded samples with a loaded model and return the text."""
+    if backend == 'faster-whisper':
+        segments, _ = model.transcribe(audio, language=language)
+        return ''.join(segment.text for segment in segments)
+
+    result = model.transcribe(
+        audio,
+        language=language,
+        fp16=CUDA_AVAILABLE  # FP16 is unsupported on CPU
+    )
+    return result['text']
+
+
+def preload_model(model_size='base', backend='whisper'):
+    """
+    Load the transcription model into the cache ahead of the first transcription.
+
+    Meant to run in a background thread while audio downloads, so model
+    loading overlaps with the network transfer. Does nothing if the
+    backend isn't installed; transcribe_audio reports that error.
+    """
+    if backend == 'faster-whisper':
+        if FASTER_WHISPER_AVAILABLE:
+            _get_model(model_size, backend)
+    elif WHISPER_AVAILABLE:
+        _get_model(model_size, backend)
+
+
+# Length of the slices handed to each worker in parallel transcription
+CHUNK_SECONDS = 30
+
+
+def _init_transcribe_worker(model_size, backend, threads):
+    """Process pool initializer: split the CPU between workers and load the model."""
+    global _CPU_THREADS
+    _CPU_THREADS = threads
+    if torch is not None:
+        torch.set_num_threads(threads)
+    _get_model(model_size, backend)
+
+
+def _transcribe_chunk(index, chunk, language, model_size, backend):
+    """Transcribe one slice of audio in a worker process."""
+    return index, _run_model(_get_model(model_size, backend), chunk, language, backend)
+
+
+def create_transcribe_pool(model_size, backend, workers):
+    """
+    Start worker processes for parallel transcription.
+
+    Each worker loads its own copy of the model once, so reuse the pool
+    across episodes rather than creating one per transcription.
+
+    Args:
+        model_size (str): Whisper model size
+        backend (str): Transcription backend, see transcribe_audio
+        workers (int): Number of worker processes
+
+    Returns:
+        ProcessPoolExecutor: Pool to pass to transcribe_audio
+    """
+    threads = max(1, (os.cpu_count() or 1) // workers)
+
+    # spawn rather than fork: the parent already runs threads and may hold torch state
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_transcribe_worker,
+        initargs=(model_size, backend, threads)
+    )
+
+
+def _transcribe_parallel(audio, language, model_size, backend, workers, pool):
+    """
+    Transcribe CHUNK_SECONDS slices of audio in the pool's worker processes.
+
+    Slices are transcribed independently, so a word straddling a boundary
+    may be cut or garbled and the language is detected per slice when not
+    given.
+    """
+    step = CHUNK_SECONDS * SAMPLE_RATE
+    chunks = np.split(audio, range(step, len(audio), step))
+
+    print(f"Transcribing {len(chunks)} chunks with {workers} worker processes...")
+
+    futures = [
+        pool.submit(_transcribe_chunk, index, chunk, language, model_size, backend)
+        for index, chunk in enumerate(chunks)
+    ]
+    results = sorted(future.result() for future in futures)
+
+    return ' '.join(text.strip() for _, text in results if text.strip())
+
+
+def transcribe_audio(audio_file, language='en', model_size='base', backend='whisper', workers=1, pool=None):
     """
     Transcribe audio file using local Whisper.
 
@@ -284,28 +697,39 @@ def transcribe_audio(audio_file, language='en', model_size='base'):
         audio_file (Path): Path to audio file
         language (str): Language code
         model_size (str): Whisper model size
+        backend (str): 'whisper' (OpenAI Whisper) or 'faster-whisper'
+        workers (int): Worker processes for CPU transcription in parallel
+            CHUNK_SECONDS slices (ignored on CUDA)
+        pool (ProcessPoolExecutor): Pool from create_transcribe_pool to reuse
+            instead of starting workers for this file only
 
     Returns:
         str: Transcribed text
     """
-    if not WHISPER_AVAILABLE:
+    if backend == 'faster-whisper':
+        if not FASTER_WHISPER_AVAILABLE:
+            raise Exception("faster-whisper is not installed. Install with: uv add faster-whisper")
+    elif not WHISPER_AVAILABLE:
         raise Exception("OpenAI Whisper is not installed. Install with: uv add openai-whisper")
 
-    print(f"\nTranscribing with Whisper (model: {model_size})...")
+    print(f"\nTranscribing with {'faster-whisper' if backend == 'faster-whisper' else 'Whisper'} (model: {model_size})...")
     print("Note: First run will download the model")
 
+    language = language if language != 'auto' else None
+
     try:
-        print("Loading Whisper model...")
-        model = whisper.load_model(model_size)
+        audio = load_audio_16k(audio_file)
 
-        print("Transcribing audio (this may take several minutes)...")
-        result = model.transcribe(
-            str(audio_file),
-            language=language if language != 'auto' else None,
-            fp16=False
-        )
+        if workers > 1 and not CUDA_AVAILABLE:
+            if pool is not None:
+                return _transcribe_parallel(audio, language, model_size, backend, workers, pool)
+            with create_transcribe_pool(model_size, backend, workers) as pool:
+                return _transcribe_parallel(audio, language, model_size, backend, workers, pool)
+
+        model = _get_model(model_size, backend)
 
-        return result['text']
+        print("Transcribing audio (this may take several minutes)...")
+        return _run_model(model, audio, language, backend)
 
     except Exception as e:
         raise Exception(f"Transcription failed: {e}")
@@ -328,6 +752,87 @@ def save_transcript(text, output_path, metadata=None):
     print(f"\nTranscript saved to: {output_path.absolute()}")
 
 
+def fetch_episode(url, platform_cfg, audio_dir, show_progress=True, skip_metadata=False):
+    """
+    Extract the audio URL of an episode and download it.
+
+    Args:
+        url (str): Episode page URL
+        platform_cfg (dict): Platform entry from PLATFORMS
+        audio_dir (Path): Directory to save audio
+        show_progress (bool): Print a progress line while downloading
+        skip_metadata (bool): Passed to extract_audio_url
+
+    Returns:
+        dict: Episode details (url, episode_title, show_title, safe_filename, url_hash, audio_file)
+    """
+    print(f"Platform: {platform_cfg['name']}")
+    audio_url, episode_title, show_title = extract_audio_url(url, platform_cfg, skip_metadata)
+
+    # Create safe filename from episode title; the URL hash keeps concurrent
+    # downloads of episodes with the same cleaned-up title apart
+    safe_filename = _SAFE_FN_RE.sub('-', episode_title)[:50].strip('-') or 'episode'
+    url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+    audio_filename = f"{safe_filename}-{url_hash}.mp3"
+
+    audio_file = download_audio(audio_url, audio_dir, audio_filename, show_progress)
+
+    return {
+        'url': url,
+        'episode_title': episode_title,
+        'show_title': show_title,
+        'safe_filename': safe_filename,
+        'url_hash': url_hash,
+        'audio_file': audio_file,
+    }
+
+
+def transcribe_episode(episode, output_path=None, language='auto', model_size='base', backend='whisper', workers=1, keep_audio=False,
+                       pool=None):
+    """
+    Transcribe a downloaded episode and save the transcript.
+
+    Args:
+        episode (dict): Episode details returned by fetch_episode
+        output_path (Path): Transcript path (default: transcripts/<episode-name>.txt)
+        language (str): Language code
+        model_size (str): Whisper model size
+        backend (str): Transcription backend, see transcribe_audio
+        workers (int): Transcription worker processes, see transcribe_audio
+        keep_audio (bool): Keep the downloaded audio file
+        pool (ProcessPoolExecutor): Reusable pool from create_transcribe_pool
+    """
+    audio_file = episode['audio_file']
+
+    # Transcribe
+    transcript_text = transcribe_audio(audio_file, language, model_size, backend, workers, pool)
+
+    # Determine output path
+    if output_path is None:
+        output_path = Path('transcripts') / f"{episode['safe_filename']}.txt"
+
+    # Save transcript with metadata
+    metadata = {
+        'Show': episode['show_title'],
+        'Episode': episode['episode_title'],
+        'Source': episode['url'],
+        'Language': language,
+        'Model': model_size,
+        'Backend': backend
+    }
+
+    save_transcript(transcript_text, output_path, metadata)
+
+    # Cleanup audio file if not keeping it
+    if not keep_audio and audio_file.exists():
+        print(f"Cleaning up audio file: {audio_file}")
+        audio_file.unlink()
+    elif keep_audio:
+        print(f"Audio file saved at: {audio_file}")
+
+    print("\nTranscription completed successfully!")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Download and transcribe podcasts from various platforms",
@@ -348,12 +853,17 @@ Examples:
 
   # Specify output location
   python podcast_transcriber.py "PODCAST_URL" -o my_transcript.txt
+
+  # Transcribe several episodes, downloading them in parallel
+  python podcast_transcriber.py "PODCAST_URL_1" "PODCAST_URL_2" "PODCAST_URL_3"
         """
     )
 
     parser.add_argument(
-        'url',
-        help='Podcast episode URL (Acast and Apple Podcasts supported)'
+        'urls',
+        nargs='+',
+        metavar='url',
+        help='Podcast episode URL(s) (Acast and Apple Podcasts supported)'
     )
 
     parser.add_argument(
@@ -374,10 +884,25 @@ Examples:
         help='Whisper model size (default: base)'
     )
 
+    parser.add_argument(
+        '--backend',
+        default='whisper',
+        choices=['whisper', 'faster-whisper'],
+        help='Transcription backend: OpenAI Whisper or faster-whisper with int8 quantization (default: whisper)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Transcribe 30-second chunks in this many processes on CPU-only machines (default: 1). '
+             'Each process loads its own copy of the model'
+    )
+
     parser.add_argument(
         '--keep-audio',
         action='store_true',
-        help='Keep downloaded audio file after transcription'
+        help='Keep downloaded audio file after transcription (kept files are reused by later runs if unchanged)'
     )
 
     parser.add_argument(
@@ -386,61 +911,86 @@ Examples:
         help='Directory to save audio files (default: temp directory)'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=4,
+        help='Number of episodes to fetch and download concurrently (default: 4)'
+    )
+
     args = parser.parse_args()
 
-    try:
-        # Determine platform
-        if 'acast.com' in args.url:
-            print("Platform: Acast")
-            audio_url, episode_title, show_title = extract_acast_audio_url(args.url)
-        elif 'podcasts.apple.com' in args.url:
-            print("Platform: Apple Podcasts")
-            audio_url, episode_title, show_title = extract_apple_podcasts_audio_url(args.url)
-        else:
-            print("Error: Unsupported platform. Currently only Acast and Apple Podcasts are supported.", file=sys.stderr)
+    # The same URL twice would download to the same file concurrently
+    args.urls = list(dict.fromkeys(args.urls))
+
+    if args.output and len(args.urls) > 1:
+        parser.error("--output can only be used with a single URL")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    # Determine platforms up front so an unsupported URL fails before any work
+    platforms = []
+    for url in args.urls:
+        platform_cfg = detect_platform(url)
+        if platform_cfg is None:
+            print(f"Error: Unsupported platform: {url}. Currently only Acast and Apple Podcasts are supported.", file=sys.stderr)
             sys.exit(1)
-
-        # Download audio
-        audio_dir = Path(args.audio_dir) if args.audio_dir else Path(tempfile.gettempdir()) / 'podcast_audio'
-
-        # Create safe filename from episode title
-        safe_filename = re.sub(r'[^\w\s-]', '', episode_title)
-        safe_filename = re.sub(r'[-\s]+', '-', safe_filename)[:50]
-        audio_filename = f"{safe_filename}.mp3"
-
-        audio_file = download_audio(audio_url, audio_dir, audio_filename)
-
-        # Transcribe
-        transcript_text = transcribe_audio(audio_file, args.language, args.model)
-
-        # Determine output path
-        if args.output:
-            output_path = Path(args.output)
-        else:
-            output_path = Path('transcripts') / f"{safe_filename}.txt"
-
-        # Save transcript with metadata
-        metadata = {
-            'Show': show_title,
-            'Episode': episode_title,
-            'Source': args.url,
-            'Language': args.language,
-            'Model': args.model
-        }
-
-        save_transcript(transcript_text, output_path, metadata)
-
-        # Cleanup audio file if not keeping it
-        if not args.keep_audio and audio_file.exists():
-            print(f"Cleaning up audio file: {audio_file}")
-            audio_file.unlink()
-        elif args.keep_audio:
-            print(f"Audio file saved at: {audio_file}")
-
-        print("\nTranscription completed successfully!")
-
-    except Exception as e:
-        print(f"\nError: {e}", file=sys.stderr)
+        platforms.append(platform_cfg)
+
+    audio_dir = Path(args.audio_dir) if args.audio_dir else Path(tempfile.gettempdir()) / 'podcast_audio'
+    output_path = Path(args.output) if args.output else None
+
+    # Progress lines from concurrent downloads would overwrite each other
+    show_progress = len(args.urls) == 1
+
+    # With --output, titles are only used in the transcript header, so don't
+    # fetch the page for them when the audio URL can be built directly
+    skip_metadata = bool(args.output)
+    written = set()
+    failed = 0
+
+    # Fetch and download episodes concurrently, but transcribe one at a time
+    # in the order given since Whisper already saturates the CPU/GPU. The
+    # model loads on its own thread meanwhile so downloads never wait on it.
+    # With parallel transcription, one process pool serves every episode so
+    # each worker loads the model only once.
+    parallel = args.workers > 1 and not CUDA_AVAILABLE
+    with ThreadPoolExecutor(max_workers=1) as loader, \
+            ThreadPoolExecutor(max_workers=args.jobs) as executor, \
+            (create_transcribe_pool(args.model, args.backend, args.workers) if parallel else contextlib.nullcontext()) as pool:
+        # Parallel transcription loads the model in each worker instead
+        model_future = None
+        if not parallel:
+            model_future = loader.submit(preload_model, args.model, args.backend)
+        futures = [
+            executor.submit(fetch_episode, url, platform_cfg, audio_dir, show_progress, skip_metadata)
+            for url, platform_cfg in zip(args.urls, platforms)
+        ]
+
+        for url, future in zip(args.urls, futures):
+            try:
+                episode = future.result()
+                if model_future:
+                    model_future.result()
+
+                # Episodes whose titles clean up to the same name would share a
+                # transcript file, so later ones get the URL hash appended
+                episode_output = output_path
+                if episode_output is None:
+                    episode_output = Path('transcripts') / f"{episode['safe_filename']}.txt"
+                    if episode_output in written:
+                        episode_output = episode_output.with_name(f"{episode['safe_filename']}-{episode['url_hash']}.txt")
+                written.add(episode_output)
+
+                transcribe_episode(episode, episode_output, args.language, args.model, args.backend, args.workers,
+                                   args.keep_audio, pool)
+            except Exception as e:
+                print(f"\nError processing {url}: {e}", file=sys.stderr)
+                failed += 1
+
+    if failed:
         sys.exit(1)
 
 
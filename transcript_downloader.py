@@ -6,16 +6,54 @@ Falls back to downloading audio and transcribing with local Whisper or Whishper
 """
 
 import argparse
+import contextlib
+import functools
+import gc
+import itertools
+import json
 import sys
 import os
+import shutil
 import subprocess
+import wave
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.formatters import TextFormatter, JSONFormatter, WebVTTFormatter
 import re
 import requests
+import yt_dlp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# requests-toolbelt streams multipart uploads instead of building them in memory - optional
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# orjson parses Whishper responses faster than the stdlib - optional
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Try to import faster-whisper (CTranslate2) - preferred local backend, optional
+try:
+    from faster_whisper import WhisperModel
+    from faster_whisper.vad import VadOptions, get_speech_timestamps as get_fw_speech_timestamps
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# Batched faster-whisper inference (faster-whisper >= 1.1)
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
 
 # Try to import whisper - it's optional
 try:
@@ -24,6 +62,113 @@ try:
 except ImportError:
     WHISPER_AVAILABLE = False
 
+LOCAL_WHISPER_AVAILABLE = FASTER_WHISPER_AVAILABLE or WHISPER_AVAILABLE
+
+# Local Whisper runs on CUDA when available
+try:
+    import torch
+    CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    torch = None
+    CUDA_AVAILABLE = False
+
+# numpy ships with every local Whisper backend and is only needed to decode audio in memory
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# WhisperTRT (TensorRT engines for NVIDIA GPUs) - optional
+try:
+    from whisper_trt import load_trt_model
+    WHISPER_TRT_AVAILABLE = True
+except ImportError:
+    WHISPER_TRT_AVAILABLE = False
+
+# English-only model sizes WhisperTRT can build engines for
+WHISPER_TRT_MODELS = {'tiny', 'base', 'small'}
+
+# Hugging Face Transformers - optional, used for the torch.compile GPU path
+try:
+    from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
+    TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    TRANSFORMERS_AVAILABLE = False
+
+# Hugging Face checkpoints for the --whisper-model sizes
+HF_WHISPER_MODELS = {
+    'tiny': 'openai/whisper-tiny',
+    'base': 'openai/whisper-base',
+    'small': 'openai/whisper-small',
+    'medium': 'openai/whisper-medium',
+    'large': 'openai/whisper-large-v3',
+}
+
+# Size of the blocks a streamed upload body is read and sent in (urllib3's default is 16 KiB)
+UPLOAD_BLOCK_SIZE = 1 << 20
+
+
+class _UploadAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send streamed bodies in UPLOAD_BLOCK_SIZE blocks."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['blocksize'] = UPLOAD_BLOCK_SIZE
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Shared HTTP session so Whishper uploads reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = _UploadAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+# Characters allowed in a YouTube video ID
+_VIDEO_ID_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-')
+
+# An 11-character video ID after "v=" (watch?v=...) or a path slash
+# (youtu.be/..., embed/..., shorts/...)
+_VIDEO_ID_RE = re.compile(r'(?:v=|/)([0-9A-Za-z_-]{11})')
+
+# Local Whisper backends expect 16 kHz mono float32 samples
+SAMPLE_RATE = 16000
+
+# Where downloaded audio is kept until it has been transcribed
+AUDIO_TEMP_DIR = Path(tempfile.gettempdir()) / 'youtube_transcripts'
+
+# Silence shorter than this is kept when VAD cuts non-speech audio
+VAD_PARAMETERS = {'min_silence_duration_ms': 500}
+
+# Silero VAD release loaded from torch.hub when faster-whisper isn't installed
+SILERO_VAD_REPO = 'snakers4/silero-vad:v5.1'
+
+# Upload content types for the audio containers yt-dlp saves
+AUDIO_CONTENT_TYPES = {
+    '.webm': 'audio/webm',
+    '.m4a': 'audio/mp4',
+    '.mp4': 'audio/mp4',
+    '.opus': 'audio/ogg',
+    '.ogg': 'audio/ogg',
+    '.mp3': 'audio/mpeg',
+}
+
+# whisper.cpp CLI and its 5-bit quantized GGML models for the --whisper-model sizes
+WHISPER_CPP_BIN = 'whisper-cli'
+WHISPER_CPP_MODEL_DIR = Path('models')
+WHISPER_CPP_MODELS = {
+    'tiny': 'ggml-tiny-q5_1.bin',
+    'base': 'ggml-base-q5_1.bin',
+    'small': 'ggml-small-q5_1.bin',
+    'medium': 'ggml-medium-q5_0.bin',
+    'large': 'ggml-large-v3-q5_0.bin',
+}
+
+# Languages probed by --list-transcripts
+COMMON_LANGUAGES = ['en', 'fr', 'es', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh-Hans', 'ar']
+
 
 def extract_video_id(url):
     """
@@ -36,21 +181,13 @@ def extract_video_id(url):
         str: Video ID
     """
     # If it's already a video ID (11 characters), return it
-    if re.match(r'^[a-zA-Z0-9_-]{11}$', url):
+    if len(url) == 11 and _VIDEO_ID_CHARS.issuperset(url):
         return url
 
     # Extract from various YouTube URL formats
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'(?:embed\/)([0-9A-Za-z_-]{11})',
-        r'(?:watch\?v=)([0-9A-Za-z_-]{11})',
-        r'^([0-9A-Za-z_-]{11})$'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1)
 
     raise ValueError(f"Could not extract video ID from: {url}")
 
@@ -115,55 +252,79 @@ def format_transcript(transcript_data, format_type='text'):
         raise ValueError(f"Unknown format type: {format_type}")
 
 
+# Directories already created in this run
+_CREATED_DIRS = set()
+
+
+def _ensure_dir(path):
+    """Create a directory (and parents) the first time it is needed in this run."""
+    if path not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
+
 def save_transcript(transcript_text, output_path):
     """
     Save transcript to file.
 
+    The text goes to a temporary file next to the target that then replaces
+    it, so an interrupted run never leaves a truncated transcript behind.
+
     Args:
         transcript_text (str): Formatted transcript
         output_path (Path): Output file path
     """
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(transcript_text)
+    _ensure_dir(output_path.parent)
+
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        tmp_path.write_text(transcript_text, encoding='utf-8')
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
-def download_audio(url, output_dir):
+def download_audio(url, output_dir=AUDIO_TEMP_DIR):
     """
     Download audio from YouTube video using yt-dlp.
 
+    The best audio stream is saved as-is (usually Opus in WebM or AAC in
+    M4A) rather than re-encoded to MP3; Whisper and Whishper decode it with
+    ffmpeg either way.
+
     Args:
         url (str): YouTube video URL
-        output_dir (Path): Directory to save audio file
+        output_dir (Path): Directory to save audio file (default: AUDIO_TEMP_DIR)
 
     Returns:
         Path: Path to downloaded audio file
     """
     output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
 
     # Create a temporary filename
     output_template = str(output_dir / "%(id)s.%(ext)s")
 
     print("Downloading audio from YouTube...")
 
-    # Use yt-dlp to download audio only
-    cmd = [
-        'yt-dlp',
-        '--extract-audio',
-        '--audio-format', 'mp3',
-        '--audio-quality', '0',  # Best quality
-        '--output', output_template,
-        '--no-playlist',
-        url
-    ]
+    # Run yt-dlp in-process to download the audio stream only
+    ydl_opts = {
+        'format': 'bestaudio/best',
+        'outtmpl': output_template,
+        'noplaylist': True,
+        'quiet': True,
+        'no_warnings': True,
+        'noprogress': True,
+    }
 
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=True)
 
-        # Find the downloaded file
-        video_id = extract_video_id(url)
-        audio_file = output_dir / f"{video_id}.mp3"
+            # Find the downloaded file
+            downloads = info.get('requested_downloads') or [{}]
+            audio_file = Path(downloads[0].get('filepath') or ydl.prepare_filename(info))
 
         if audio_file.exists():
             print(f"Audio downloaded: {audio_file}")
@@ -171,8 +332,74 @@ def download_audio(url, output_dir):
         else:
             raise Exception("Audio file not found after download")
 
-    except subprocess.CalledProcessError as e:
-        raise Exception(f"Failed to download audio: {e.stderr}")
+    except yt_dlp.utils.DownloadError as e:
+        raise Exception(f"Failed to download audio: {e}")
+
+
+def decode_audio_stream(url):
+    """
+    Download audio from YouTube video and decode it in memory.
+
+    yt-dlp writes the best audio stream to stdout and ffmpeg decodes it from
+    the pipe to 16 kHz mono PCM, so the audio is never written to disk and
+    the Whisper backends don't have to run ffmpeg on it again.
+
+    Args:
+        url (str): YouTube video URL
+
+    Returns:
+        np.ndarray: float32 samples in [-1.0, 1.0)
+    """
+    print("Downloading and decoding audio from YouTube...")
+
+    ytdlp_cmd = [
+        'yt-dlp',
+        '--format', 'bestaudio/best',
+        '--output', '-',
+        '--no-playlist',
+        '--quiet',
+        url
+    ]
+    ffmpeg_cmd = [
+        'ffmpeg', '-nostdin', '-loglevel', 'error', '-threads', '0',
+        '-i', 'pipe:0',
+        '-f', 's16le', '-ac', '1', '-ar', str(SAMPLE_RATE),
+        'pipe:1'
+    ]
+
+    # yt-dlp's stderr goes to a file so a full pipe can never stall it
+    with tempfile.TemporaryFile() as ytdlp_err:
+        try:
+            ytdlp = subprocess.Popen(ytdlp_cmd, stdout=subprocess.PIPE, stderr=ytdlp_err)
+        except FileNotFoundError:
+            raise Exception("yt-dlp is not installed or not on PATH")
+
+        try:
+            ffmpeg = subprocess.Popen(ffmpeg_cmd, stdin=ytdlp.stdout, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except FileNotFoundError:
+            ytdlp.kill()
+            ytdlp.wait()
+            raise Exception("ffmpeg is not installed or not on PATH")
+        finally:
+            ytdlp.stdout.close()  # ffmpeg holds its own copy of the read end
+
+        pcm, ffmpeg_stderr = ffmpeg.communicate()
+        ytdlp.wait()
+
+        if ytdlp.returncode != 0:
+            ytdlp_err.seek(0)
+            raise Exception(f"Failed to download audio: {ytdlp_err.read().decode(errors='replace')}")
+
+    if ffmpeg.returncode != 0:
+        raise Exception(f"Failed to decode audio: {ffmpeg_stderr.decode(errors='replace')}")
+
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+
+@functools.lru_cache(maxsize=None)
+def _whishper_endpoint(whishper_url):
+    """Return the transcription API endpoint for a Whishper server URL."""
+    return f"{whishper_url.rstrip('/')}/api/transcriptions"
 
 
 def transcribe_with_whishper(audio_file, whishper_url, language='en'):
@@ -189,30 +416,36 @@ def transcribe_with_whishper(audio_file, whishper_url, language='en'):
     """
     print(f"Transcribing with Whishper at {whishper_url}...")
 
-    # Prepare the API endpoint
-    api_endpoint = f"{whishper_url.rstrip('/')}/api/transcriptions"
+    api_endpoint = _whishper_endpoint(whishper_url)
 
     try:
         # Open and send the audio file
         with open(audio_file, 'rb') as f:
-            files = {'file': (audio_file.name, f, 'audio/mpeg')}
+            content_type = AUDIO_CONTENT_TYPES.get(audio_file.suffix.lower(), 'application/octet-stream')
+            files = {'file': (audio_file.name, f, content_type)}
             data = {
                 'language': language,
                 'task': 'transcribe'
             }
 
             print("Uploading audio to Whishper (this may take a while)...")
-            response = requests.post(api_endpoint, files=files, data=data, timeout=600)
+            if MultipartEncoder is not None:
+                # The encoder reads the file as the body is sent rather than up front
+                encoder = MultipartEncoder(fields={**files, **data})
+                response = _SESSION.post(api_endpoint, data=encoder, headers={'Content-Type': encoder.content_type},
+                                         timeout=600)
+            else:
+                response = _SESSION.post(api_endpoint, files=files, data=data, timeout=600)
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
 
                 # Extract text from the response
                 if 'text' in result:
                     return result['text']
                 elif 'segments' in result:
                     # Combine all segments
-                    return ' '.join(segment.get('text', '') for segment in result['segments'])
+                    return ' '.join([segment['text'] for segment in result['segments']])
                 else:
                     raise Exception(f"Unexpected response format: {result}")
             else:
@@ -226,41 +459,575 @@ def transcribe_with_whishper(audio_file, whishper_url, language='en'):
         raise Exception(f"Transcription failed: {e}")
 
 
-def transcribe_with_local_whisper(audio_file, language='en', model_size='base'):
+def resolve_backend(backend='auto'):
     """
-    Transcribe audio file using local Whisper model.
+    Return the local Whisper backend to use.
 
     Args:
-        audio_file (Path): Path to audio file
+        backend (str): 'auto', 'faster-whisper', 'whisper', 'whisper-cpp' or
+            'whisper-trt'; 'auto' picks faster-whisper when installed, then
+            OpenAI Whisper
+
+    Returns:
+        str: Installed backend name
+    """
+    if backend == 'auto':
+        if FASTER_WHISPER_AVAILABLE:
+            return 'faster-whisper'
+        if WHISPER_AVAILABLE:
+            return 'whisper'
+        raise Exception("No local Whisper backend is installed. Install with: uv add faster-whisper")
+
+    if backend == 'faster-whisper' and not FASTER_WHISPER_AVAILABLE:
+        raise Exception("faster-whisper is not installed. Install with: uv add faster-whisper")
+    if backend == 'whisper' and not WHISPER_AVAILABLE:
+        raise Exception("OpenAI Whisper is not installed. Install with: uv add openai-whisper")
+    if backend == 'whisper-cpp' and shutil.which(WHISPER_CPP_BIN) is None:
+        raise Exception(f"whisper.cpp is not installed ({WHISPER_CPP_BIN} not found on PATH)")
+    if backend == 'whisper-trt':
+        if not WHISPER_TRT_AVAILABLE:
+            raise Exception("whisper_trt is not installed. See https://github.com/NVIDIA-AI-IOT/whisper_trt")
+        if not CUDA_AVAILABLE:
+            raise Exception("whisper_trt needs a CUDA GPU")
+
+    return backend
+
+
+def _write_wav_16k(audio, wav_path):
+    """Write an audio file or 16 kHz samples as a 16 kHz mono 16-bit WAV file."""
+    if isinstance(audio, Path):
+        cmd = [
+            'ffmpeg', '-nostdin', '-loglevel', 'error', '-y',
+            '-i', str(audio),
+            '-ac', '1', '-ar', str(SAMPLE_RATE), '-c:a', 'pcm_s16le',
+            str(wav_path)
+        ]
+        try:
+            subprocess.run(cmd, check=True, capture_output=True)
+        except FileNotFoundError:
+            raise Exception("ffmpeg is not installed or not on PATH")
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"Failed to decode audio: {e.stderr.decode(errors='replace')}")
+        return
+
+    with wave.open(str(wav_path), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes((np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes())
+
+
+def transcribe_with_whisper_cpp(audio_file, language=None, model_size='base', ggml_model=None, cpu_threads=0):
+    """
+    Transcribe audio with the whisper.cpp CLI and a quantized GGML model.
+
+    Args:
+        audio_file (Path or np.ndarray): Path to audio file, or 16 kHz mono samples
+        language (str): Language code, or None to auto-detect
+        model_size (str): Whisper model size, used to pick the default model
+        ggml_model (str): Path to a GGML model file (default:
+            models/<WHISPER_CPP_MODELS[model_size]>)
+        cpu_threads (int): Threads for whisper.cpp (0 = its default)
+
+    Returns:
+        str: Transcribed text
+    """
+    resolve_backend('whisper-cpp')
+
+    model_path = Path(ggml_model) if ggml_model else WHISPER_CPP_MODEL_DIR / WHISPER_CPP_MODELS[model_size]
+    if not model_path.exists():
+        raise Exception(f"whisper.cpp model not found: {model_path}. "
+                        f"Download it with whisper.cpp's models/download-ggml-model.sh")
+
+    print(f"Transcribing audio with whisper.cpp ({model_path.name})...")
+
+    # whisper.cpp reads 16 kHz WAV input
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        wav_path = Path(tmp_dir) / 'audio.wav'
+        _write_wav_16k(audio_file, wav_path)
+
+        cmd = [
+            WHISPER_CPP_BIN,
+            '-m', str(model_path),
+            '-f', str(wav_path),
+            '-l', language or 'auto',
+            '--no-timestamps',
+            '--no-prints'
+        ]
+        if cpu_threads:
+            cmd += ['-t', str(cpu_threads)]
+
+        try:
+            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"whisper.cpp failed: {e.stderr}")
+
+    return ' '.join(line.strip() for line in result.stdout.splitlines() if line.strip())
+
+
+class WhisperManager:
+    """
+    Process-wide holder for the local Whisper model.
+
+    The model is loaded on first use and reused by later calls with the same
+    (backend, device, model_size, compute_type, cpu_threads, compile); asking
+    for a different configuration unloads the old model first. `backend`
+    records which library the current model comes from.
+    """
+
+    _model = None
+    backend = None
+    _requested_backend = None
+    _device = None
+    _model_size = None
+    _compute_type = None
+    _cpu_threads = None
+    _compile = False
+
+    @classmethod
+    def get_model(cls, model_size='base', device=None, compute_type='auto', cpu_threads=0, compile_model=False,
+                  backend='auto'):
+        """
+        Return the loaded model, loading it if the configuration changed.
+
+        Args:
+            model_size (str): Whisper model size
+            device (str): 'cuda' or 'cpu' (default: cuda if available)
+            compute_type (str): faster-whisper compute type, or 'auto' for
+                float16 on CUDA and int8 on CPU
+            cpu_threads (int): faster-whisper CPU threads (0 = library default)
+            compile_model (bool): Use the Transformers backend with a static
+                KV-cache and torch.compile (CUDA only)
+            backend (str): 'faster-whisper', 'whisper', 'whisper-trt' or
+                'auto' for faster-whisper when installed
+
+        Returns:
+            faster_whisper.WhisperModel, whisper.Whisper or a Transformers
+            pipeline: Loaded model
+        """
+        if device is None:
+            device = 'cuda' if CUDA_AVAILABLE else 'cpu'
+        if compute_type == 'auto':
+            compute_type = 'float16' if device == 'cuda' else 'int8'
+
+        if compile_model and not (TRANSFORMERS_AVAILABLE and device == 'cuda'):
+            print("Note: --compile needs transformers and a CUDA GPU, using the default backend")
+            compile_model = False
+
+        if not compile_model:
+            backend = resolve_backend(backend)
+
+        config = (backend, device, model_size, compute_type, cpu_threads, compile_model)
+        current = (cls._requested_backend, cls._device, cls._model_size, cls._compute_type, cls._cpu_threads, cls._compile)
+        if cls._model is None or config != current:
+            cls._load(*config)
+
+        return cls._model
+
+    @classmethod
+    def _load(cls, backend, device, model_size, compute_type, cpu_threads, compile_model):
+        """Replace the current model with one for the given configuration."""
+        cls.unload()
+
+        if compile_model:
+            cls._model = cls._load_compiled(model_size, device)
+            cls.backend = 'transformers'
+        elif backend == 'faster-whisper':
+            print(f"Loading faster-whisper model ({device}, {compute_type})...")
+            cls._model = WhisperModel(model_size, device=device, compute_type=compute_type, cpu_threads=cpu_threads)
+            cls.backend = 'faster-whisper'
+        elif backend == 'whisper-trt':
+            if model_size not in WHISPER_TRT_MODELS:
+                raise Exception(f"whisper_trt supports only the {', '.join(sorted(WHISPER_TRT_MODELS))} models")
+            # Builds the TensorRT engine on first use and caches it under ~/.cache/whisper_trt
+            print(f"Loading WhisperTRT model {model_size}.en...")
+            cls._model = load_trt_model(f"{model_size}.en")
+            cls.backend = 'whisper-trt'
+        else:
+            print(f"Loading Whisper model...")
+            cls._model = whisper.load_model(model_size, device=device)
+            cls.backend = 'whisper'
+
+        cls._requested_backend = backend
+        cls._device = device
+        cls._model_size = model_size
+        cls._compute_type = compute_type
+        cls._cpu_threads = cpu_threads
+        cls._compile = compile_model
+
+    @staticmethod
+    def _load_compiled(model_size, device):
+        """
+        Load a Transformers Whisper pipeline with a compiled forward pass.
+
+        The static KV-cache keeps tensor shapes fixed across decoding steps so
+        torch.compile can capture each step as a single CUDA graph. The first
+        transcription pays the compilation cost; later ones reuse it.
+        """
+        model_id = HF_WHISPER_MODELS[model_size]
+        print(f"Loading Transformers model {model_id} ({device}, float16, torch.compile)...")
+
+        model = AutoModelForSpeechSeq2Seq.from_pretrained(
+            model_id, torch_dtype=torch.float16, low_cpu_mem_usage=True
+        ).to(device)
+        model.generation_config.cache_implementation = 'static'
+        model.forward = torch.compile(model.forward, mode='reduce-overhead', fullgraph=True)
+
+        processor = AutoProcessor.from_pretrained(model_id)
+        return pipeline(
+            'automatic-speech-recognition',
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            torch_dtype=torch.float16,
+            device=device,
+        )
+
+    @classmethod
+    def unload(cls):
+        """Drop the current model and release its (GPU) memory."""
+        if cls._model is None:
+            return
+
+        cls._model = None
+        cls.backend = None
+        cls._requested_backend = None
+        cls._device = None
+        cls._model_size = None
+        cls._compute_type = None
+        cls._cpu_threads = None
+        cls._compile = False
+
+        gc.collect()
+        if CUDA_AVAILABLE:
+            torch.cuda.empty_cache()
+
+
+def transcribe_with_local_whisper(audio_file, language='en', model_size='base', compute_type='auto', cpu_threads=0,
+                                  keep_model_loaded=True, compile_model=False, backend='auto', ggml_model=None,
+                                  vad=False):
+    """
+    Transcribe audio file using a local Whisper model.
+
+    By default uses faster-whisper (CTranslate2) when installed, falling back
+    to OpenAI Whisper otherwise; backend selects one explicitly, including
+    the whisper.cpp CLI. With compile_model on a CUDA host, runs the
+    Transformers backend under torch.compile instead. The model is held by
+    WhisperManager, so repeated calls with the same settings don't reload
+    (or recompile) it.
+
+    Args:
+        audio_file (Path or np.ndarray): Path to audio file, or 16 kHz mono samples
         language (str): Language code for transcription
         model_size (str): Whisper model size (tiny, base, small, medium, large)
+        compute_type (str): faster-whisper compute type, or 'auto' for
+            float16 on CUDA and int8 on CPU
+        cpu_threads (int): faster-whisper CPU threads (0 = library default)
+        keep_model_loaded (bool): Keep the model in memory for later calls
+        compile_model (bool): Use the torch.compile Transformers backend
+        backend (str): 'auto', 'faster-whisper', 'whisper', 'whisper-cpp' or 'whisper-trt'
+        ggml_model (str): GGML model path for whisper.cpp
+        vad (bool): Cut silence with Silero VAD before OpenAI Whisper
+            (faster-whisper always filters it)
 
     Returns:
         str: Transcribed text
     """
-    if not WHISPER_AVAILABLE:
-        raise Exception("OpenAI Whisper is not installed. Install with: uv add openai-whisper")
-
     print(f"Transcribing with local Whisper (model: {model_size})...")
     print("Note: First run will download the model (~140MB for base model)")
 
+    language = language if language != 'en' else None  # Auto-detect if not specified
+
     try:
-        # Load the model
-        print(f"Loading Whisper model...")
-        model = whisper.load_model(model_size)
+        if backend == 'whisper-trt' and language:
+            raise Exception(f"whisper_trt only has English models, so it can't transcribe '{language}'. "
+                            f"Use another --backend, e.g. faster-whisper")
+
+        if backend == 'whisper-cpp':
+            return transcribe_with_whisper_cpp(audio_file, language, model_size, ggml_model, cpu_threads)
+
+        model = WhisperManager.get_model(model_size, compute_type=compute_type, cpu_threads=cpu_threads,
+                                         compile_model=compile_model, backend=backend)
+
+        if WhisperManager.backend == 'transformers':
+            # Long-form audio is split into 30 s windows by the pipeline
+            print(f"Transcribing audio (first run compiles the model, this may take a few minutes)...")
+            generate_kwargs = {'task': 'transcribe'}
+            if language:
+                generate_kwargs['language'] = language
+            result = model(_audio_input(audio_file), chunk_length_s=30, generate_kwargs=generate_kwargs)
+            return result['text']
+
+        if WhisperManager.backend == 'faster-whisper':
+            # Transcribe - segments are generated lazily as decoding proceeds
+            print(f"Transcribing audio (this may take a few minutes)...")
+            segments, info = model.transcribe(_audio_input(audio_file), language=language, beam_size=5,
+                                              vad_filter=True, vad_parameters=VAD_PARAMETERS)
+            return ''.join(segment.text for segment in segments)
+
+        if WhisperManager.backend == 'whisper-trt':
+            # English-only engines, so there is no language to pass
+            print(f"Transcribing audio with TensorRT...")
+            return _transcribe_trt_windows(model, [audio_file], vad)[0]
+
+        audio = _audio_input(audio_file)
+        if vad:
+            if isinstance(audio, str):
+                audio = whisper.load_audio(audio)
+            audio = drop_silence(audio)
+
+        if model.device.type == 'cuda':
+            # Whisper computes the mel spectrogram wherever the samples live, so
+            # hand it a CUDA tensor to run the STFT on the GPU instead of the CPU
+            if isinstance(audio, str):
+                audio = whisper.load_audio(audio)
+            audio = torch.from_numpy(audio).to(model.device)
 
         # Transcribe
         print(f"Transcribing audio (this may take a few minutes)...")
         result = model.transcribe(
-            str(audio_file),
-            language=language if language != 'en' else None,  # Auto-detect if not specified
-            fp16=False  # Use FP32 for better compatibility
+            audio,
+            language=language,
+            fp16=CUDA_AVAILABLE  # FP16 is unsupported on CPU
         )
 
         return result['text']
 
     except Exception as e:
         raise Exception(f"Local Whisper transcription failed: {e}")
+    finally:
+        if not keep_model_loaded:
+            WhisperManager.unload()
+
+
+def _audio_input(audio):
+    """Pass audio files to the backends as path strings and decoded samples as-is."""
+    return str(audio) if isinstance(audio, Path) else audio
+
+
+@functools.lru_cache(maxsize=1)
+def _load_silero_vad():
+    """Load Silero VAD from a pinned torch.hub release (downloaded on first use)."""
+    print("Loading Silero VAD...")
+    return torch.hub.load(SILERO_VAD_REPO, 'silero_vad', trust_repo=True)
+
+
+def _speech_timestamps(audio):
+    """Return Silero VAD speech spans ({'start', 'end'} in samples) for 16 kHz audio."""
+    if FASTER_WHISPER_AVAILABLE:
+        # faster-whisper bundles the Silero model, so nothing is fetched
+        return get_fw_speech_timestamps(audio, VadOptions(**VAD_PARAMETERS))
+
+    model, (get_speech_timestamps, *_) = _load_silero_vad()
+    return get_speech_timestamps(torch.from_numpy(audio), model, sampling_rate=SAMPLE_RATE, **VAD_PARAMETERS)
+
+
+def drop_silence(audio):
+    """
+    Keep only the speech in 16 kHz mono samples, using Silero VAD.
+
+    Whisper's cost grows with audio length, so cutting silence and music
+    before decoding saves work in proportion. Text is all that is returned,
+    so timestamps don't need mapping back to the original audio.
+
+    Args:
+        audio (np.ndarray): float32 samples
+
+    Returns:
+        np.ndarray: Speech samples, concatenated
+    """
+    speech = _speech_timestamps(audio)
+    if not speech:
+        return audio[:0]
+    return np.concatenate([audio[span['start']:span['end']] for span in speech])
+
+
+def _iter_whisper_windows(audio_files, vad=False):
+    """Yield (file index, 30 s sample window) for each audio file in order."""
+    for index, audio_file in enumerate(audio_files):
+        audio = whisper.load_audio(str(audio_file)) if isinstance(audio_file, Path) else audio_file
+        if vad:
+            audio = drop_silence(audio)
+        for start in range(0, max(len(audio), 1), whisper.audio.N_SAMPLES):
+            yield index, audio[start:start + whisper.audio.N_SAMPLES]
+
+
+def _transcribe_trt_windows(model, audio_files, vad=False):
+    """
+    Transcribe files with WhisperTRT one 30 s window at a time.
+
+    WhisperTRT decodes a single padded/trimmed window per call, so longer
+    audio is split first and the window texts are joined.
+    """
+    texts = [[] for _ in audio_files]
+    for index, samples in _iter_whisper_windows(audio_files, vad):
+        texts[index].append(model.transcribe(samples)['text'].strip())
+    return [' '.join(text for text in parts if text) for parts in texts]
+
+
+def _whisper_mel_batch(model, batch, stream=None):
+    """
+    Stack log-mel spectrograms for a batch of windows on the model's device.
+
+    The samples are copied to the device first so the STFT runs there
+    (on the GPU when the model is on CUDA). With a CUDA stream, the work is
+    queued on that stream and the caller must synchronize before use.
+    """
+    with torch.cuda.stream(stream) if stream is not None else contextlib.nullcontext():
+        return torch.stack([
+            whisper.log_mel_spectrogram(
+                torch.from_numpy(whisper.pad_or_trim(samples)).to(model.device, non_blocking=True),
+                model.dims.n_mels
+            )
+            for _, samples in batch
+        ])
+
+
+def _decode_whisper_batches(model, audio_files, language, batch_size, vad=False):
+    """
+    Transcribe files with OpenAI Whisper, decoding batch_size windows per call.
+
+    Windows from all files are padded to 30 s, turned into mel spectrograms
+    of shape (n_mels, 3000) and stacked into one tensor per decode() call.
+    Each window is decoded independently, so words straddling a window
+    boundary may be cut. On CUDA, the next batch's spectrograms are
+    computed on a side stream while the current batch decodes.
+    """
+    options = whisper.DecodingOptions(language=language, fp16=CUDA_AVAILABLE)
+    texts = [[] for _ in audio_files]
+    windows = _iter_whisper_windows(audio_files, vad)
+    mel_stream = torch.cuda.Stream(device=model.device) if model.device.type == 'cuda' else None
+
+    batch = list(itertools.islice(windows, batch_size))
+    mel = _whisper_mel_batch(model, batch, mel_stream) if batch else None
+
+    while batch:
+        if mel_stream is not None:
+            torch.cuda.current_stream().wait_stream(mel_stream)
+            mel.record_stream(torch.cuda.current_stream())
+
+        # Queue the next spectrograms before decoding so the two overlap
+        next_batch = list(itertools.islice(windows, batch_size))
+        next_mel = _whisper_mel_batch(model, next_batch, mel_stream) if next_batch else None
+
+        for (index, _), result in zip(batch, whisper.decode(model, mel, options)):
+            texts[index].append(result.text.strip())
+
+        batch, mel = next_batch, next_mel
+
+    return [' '.join(text for text in parts if text) for parts in texts]
+
+
+def transcribe_batch(audio_files, language='en', model_size='base', compute_type='auto', cpu_threads=0,
+                     keep_model_loaded=True, compile_model=False, batch_size=8, backend='auto', ggml_model=None,
+                     vad=False):
+    """
+    Transcribe several audio files with one local Whisper model.
+
+    With the Transformers and OpenAI Whisper backends, 30-second windows
+    from all files are stacked into shared batches so a single generate
+    call covers several inputs. faster-whisper can only batch windows of
+    one file, so files are processed in turn with its batched pipeline;
+    whisper.cpp and WhisperTRT run once per file.
+
+    Args:
+        audio_files (list): Paths to audio files, or 16 kHz mono samples
+        language (str): Language code for transcription
+        model_size (str): Whisper model size (tiny, base, small, medium, large)
+        compute_type (str): faster-whisper compute type, or 'auto'
+        cpu_threads (int): faster-whisper CPU threads (0 = library default)
+        keep_model_loaded (bool): Keep the model in memory for later calls
+        compile_model (bool): Use the torch.compile Transformers backend
+        batch_size (int): Number of 30-second windows per forward pass
+        backend (str): 'auto', 'faster-whisper', 'whisper', 'whisper-cpp' or 'whisper-trt'
+        ggml_model (str): GGML model path for whisper.cpp
+        vad (bool): Cut silence with Silero VAD before OpenAI Whisper
+            (faster-whisper always filters it)
+
+    Returns:
+        list: Transcribed text for each file, in the same order
+    """
+    print(f"Transcribing {len(audio_files)} files with local Whisper (model: {model_size}, batch size: {batch_size})...")
+
+    language = language if language != 'en' else None  # Auto-detect if not specified
+
+    try:
+        if backend == 'whisper-trt' and language:
+            raise Exception(f"whisper_trt only has English models, so it can't transcribe '{language}'. "
+                            f"Use another --backend, e.g. faster-whisper")
+
+        if backend == 'whisper-cpp':
+            return [
+                transcribe_with_whisper_cpp(audio_file, language, model_size, ggml_model, cpu_threads)
+                for audio_file in audio_files
+            ]
+
+        model = WhisperManager.get_model(model_size, compute_type=compute_type, cpu_threads=cpu_threads,
+                                         compile_model=compile_model, backend=backend)
+
+        if WhisperManager.backend == 'transformers':
+            generate_kwargs = {'task': 'transcribe'}
+            if language:
+                generate_kwargs['language'] = language
+            results = model([_audio_input(audio) for audio in audio_files], chunk_length_s=30, batch_size=batch_size,
+                            generate_kwargs=generate_kwargs)
+            return [result['text'] for result in results]
+
+        if WhisperManager.backend == 'faster-whisper':
+            texts = []
+            for audio_file in audio_files:
+                if BatchedInferencePipeline is not None:
+                    segments, info = BatchedInferencePipeline(model=model).transcribe(
+                        _audio_input(audio_file), language=language, batch_size=batch_size,
+                        vad_filter=True, vad_parameters=VAD_PARAMETERS
+                    )
+                else:
+                    segments, info = model.transcribe(_audio_input(audio_file), language=language, beam_size=5,
+                                                      vad_filter=True, vad_parameters=VAD_PARAMETERS)
+                texts.append(''.join(segment.text for segment in segments))
+            return texts
+
+        if WhisperManager.backend == 'whisper-trt':
+            return _transcribe_trt_windows(model, audio_files, vad)
+
+        return _decode_whisper_batches(model, audio_files, language, batch_size, vad)
+
+    except Exception as e:
+        raise Exception(f"Local Whisper transcription failed: {e}")
+    finally:
+        if not keep_model_loaded:
+            WhisperManager.unload()
+
+
+def list_transcripts(video_id):
+    """
+    Print the common languages a video has transcripts in.
+
+    Args:
+        video_id (str): YouTube video ID
+    """
+    print("\nListing available transcripts...")
+
+    def _probe(lang):
+        try:
+            YouTubeTranscriptApi.get_transcript(video_id, languages=[lang])
+            return lang
+        except:
+            return None
+
+    try:
+        # Probe the common languages concurrently - each is one HTTPS round trip
+        with ThreadPoolExecutor(max_workers=len(COMMON_LANGUAGES)) as executor:
+            available = [lang for lang in executor.map(_probe, COMMON_LANGUAGES) if lang]
+
+        if available:
+            print("\nAvailable transcript languages:")
+            for lang in available:
+                print(f"  - {lang}")
+        else:
+            print("\nNo transcripts found in common languages. Try without --list-transcripts to get any available transcript.")
+    except Exception as e:
+        print(f"Error listing transcripts: {e}")
 
 
 def main():
@@ -286,12 +1053,17 @@ Examples:
 
   # Specify language preference (works for both transcript and Whishper)
   python transcript_downloader.py "https://www.youtube.com/watch?v=VIDEO_ID" -l fr,en
+
+  # Transcribe several videos, batching them through one local Whisper model
+  python transcript_downloader.py VIDEO_ID_1 VIDEO_ID_2 VIDEO_ID_3 --audio-only
         """
     )
 
     parser.add_argument(
-        'url',
-        help='YouTube video URL or video ID'
+        'urls',
+        nargs='+',
+        metavar='url',
+        help='YouTube video URL(s) or video ID(s)'
     )
 
     parser.add_argument(
@@ -324,6 +1096,12 @@ Examples:
         help='Whishper server URL (default: http://localhost:8082). Used for transcription fallback when no transcript available.'
     )
 
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Fetch and transcribe again even if the output file already exists'
+    )
+
     parser.add_argument(
         '--keep-audio',
         action='store_true',
@@ -349,120 +1127,269 @@ Examples:
         help='Whisper model size for local transcription (default: base)'
     )
 
+    parser.add_argument(
+        '--backend',
+        default='auto',
+        choices=['auto', 'faster-whisper', 'whisper', 'whisper-cpp', 'whisper-trt'],
+        help='Local transcription backend (default: auto - faster-whisper if installed, else OpenAI Whisper). '
+             'whisper-cpp runs the whisper.cpp CLI with a 5-bit quantized model; '
+             'whisper-trt runs English-only TensorRT engines on NVIDIA GPUs'
+    )
+
+    parser.add_argument(
+        '--ggml-model',
+        help='GGML model file for --backend whisper-cpp (default: models/ggml-<size>-q5_*.bin)'
+    )
+
+    parser.add_argument(
+        '--vad',
+        action='store_true',
+        help='Cut silence with Silero VAD before transcribing with OpenAI Whisper '
+             '(faster-whisper always does; uses its bundled VAD if installed, else a pinned release via torch.hub)'
+    )
+
+    parser.add_argument(
+        '--compute-type',
+        default='auto',
+        choices=['auto', 'int8', 'int8_float16', 'float16', 'float32'],
+        help='faster-whisper compute type (default: auto - float16 on GPU, int8 on CPU)'
+    )
+
+    parser.add_argument(
+        '--keep-model-loaded',
+        action='store_true',
+        help='Keep the local Whisper model in memory after transcribing (for batch use)'
+    )
+
+    parser.add_argument(
+        '--compile',
+        action='store_true',
+        help='On CUDA, run Whisper through Transformers with a static KV-cache and torch.compile '
+             '(slow first run, faster decoding; needs transformers)'
+    )
+
+    parser.add_argument(
+        '--cpu-threads',
+        type=int,
+        default=0,
+        help='Number of CPU threads for faster-whisper (default: 0, let the library decide)'
+    )
+
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=8,
+        help='30-second audio windows per local Whisper forward pass when transcribing several videos (default: 8)'
+    )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=4,
+        help='Number of audio downloads and Whishper requests to run concurrently (default: 4). '
+             'For local Whisper, each video is held in memory as decoded audio (~230 MB per hour) '
+             'until all downloads finish'
+    )
+
     args = parser.parse_args()
 
+    if args.output and len(args.urls) > 1:
+        parser.error("--output can only be used with a single URL")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
     try:
-        # Extract video ID
-        video_id = extract_video_id(args.url)
-        print(f"Video ID: {video_id}")
+        # Extract video IDs up front so a bad URL fails before any work
+        video_ids = [extract_video_id(url) for url in args.urls]
+    except ValueError as e:
+        print(f"\nError: {e}", file=sys.stderr)
+        sys.exit(1)
 
-        # List transcripts if requested
-        if args.list_transcripts:
-            print("\nListing available transcripts...")
-            try:
-                # Try common languages to see what's available
-                common_langs = ['en', 'fr', 'es', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh-Hans', 'ar']
-                available = []
-                for lang in common_langs:
-                    try:
-                        YouTubeTranscriptApi.get_transcript(video_id, languages=[lang])
-                        available.append(lang)
-                    except:
-                        pass
-
-                if available:
-                    print("\nAvailable transcript languages:")
-                    for lang in available:
-                        print(f"  - {lang}")
-                else:
-                    print("\nNo transcripts found in common languages. Try without --list-transcripts to get any available transcript.")
-            except Exception as e:
-                print(f"Error listing transcripts: {e}")
+    # The same video twice would download to the same file concurrently, so
+    # keep only the first URL given for each video ID
+    first_urls = {}
+    for url, video_id in zip(args.urls, video_ids):
+        first_urls.setdefault(video_id, url)
+    video_ids = list(first_urls)
+    args.urls = list(first_urls.values())
+
+    # List transcripts if requested
+    if args.list_transcripts:
+        for video_id in video_ids:
+            print(f"Video ID: {video_id}")
+            list_transcripts(video_id)
+        return
+
+    # Parse languages
+    languages = [lang.strip() for lang in args.languages.split(',')]
+    primary_language = languages[0] if languages else 'en'
+    use_local = args.use_local_whisper or args.backend != 'auto' or LOCAL_WHISPER_AVAILABLE
+    transcripts = [None] * len(video_ids)
+    cached = set()
+    failed = 0
+
+    # Determine output paths
+    if args.output:
+        output_paths = [Path(args.output)]
+    else:
+        extension = args.format if args.format != 'text' else 'txt'
+        output_paths = [Path('transcripts') / f"{video_id}.{extension}" for video_id in video_ids]
 
-            return
+    # Try to get existing transcripts first (unless --audio-only)
+    for i, video_id in enumerate(video_ids):
+        print(f"Video ID: {video_id}")
 
-        # Parse languages
-        languages = [lang.strip() for lang in args.languages.split(',')]
-        transcript_text = None
-        audio_file = None
+        # Skip videos already saved by an earlier run
+        if output_paths[i].exists() and not args.force:
+            print(f"Transcript already saved: {output_paths[i].absolute()} (use --force to redo)")
+            cached.add(i)
+            continue
 
-        # Try to get existing transcript first (unless --audio-only)
-        if not args.audio_only:
-            try:
-                print(f"Fetching transcript (preferred languages: {', '.join(languages)})...")
-                transcript_data, language_used = get_transcript(video_id, languages)
-                print(f"Found transcript in: {language_used}")
-                print(f"Transcript entries: {len(transcript_data)}")
+        if args.audio_only:
+            continue
 
-                # Format transcript
-                transcript_text = format_transcript(transcript_data, args.format)
-            except Exception as e:
-                print(f"No transcript available: {e}")
-                if args.use_local_whisper or WHISPER_AVAILABLE:
-                    print("Falling back to audio transcription with local Whisper...")
-                else:
-                    print("Falling back to audio transcription with Whishper...")
+        try:
+            print(f"Fetching transcript (preferred languages: {', '.join(languages)})...")
+            transcript_data, language_used = get_transcript(video_id, languages)
+            print(f"Found transcript in: {language_used}")
+            print(f"Transcript entries: {len(transcript_data)}")
+
+            # Format transcript
+            transcripts[i] = format_transcript(transcript_data, args.format)
+        except Exception as e:
+            print(f"No transcript available: {e}")
+            if use_local:
+                print("Falling back to audio transcription with local Whisper...")
+            else:
+                print("Falling back to audio transcription with Whishper...")
 
-        # If no transcript, use transcription
-        if transcript_text is None:
-            try:
-                # Download audio
-                temp_dir = Path(tempfile.gettempdir()) / 'youtube_transcripts'
-                audio_file = download_audio(args.url, temp_dir)
+    pending = [i for i, text in enumerate(transcripts) if text is None and i not in cached]
+    audio_files = {}
 
-                primary_language = languages[0] if languages else 'en'
+    def _transcribe_with_whishper(i):
+        if i not in audio_files:
+            audio_files[i] = download_audio(args.urls[i])
+        return transcribe_with_whishper(audio_files[i], args.whishper_url, primary_language)
 
-                # Try local Whisper first if available or requested
-                if args.use_local_whisper or WHISPER_AVAILABLE:
-                    try:
-                        transcript_text = transcribe_with_local_whisper(
-                            audio_file,
+    try:
+        # Check the local backend is installed before downloading anything for it
+        if pending and use_local and not (args.compile and TRANSFORMERS_AVAILABLE and CUDA_AVAILABLE):
+            try:
+                resolve_backend(args.backend)
+            except Exception as backend_error:
+                if args.use_local_whisper:
+                    # User explicitly requested local whisper, don't fallback
+                    print(f"\nError during audio transcription: {backend_error}", file=sys.stderr)
+                    failed += len(pending)
+                    pending = []
+                else:
+                    print(f"\nLocal Whisper unavailable: {backend_error}")
+                    print("Falling back to Whishper server...")
+                    use_local = False
+
+        # Try local Whisper first if available or requested
+        if pending and use_local:
+            # Unless the audio is kept, decode it straight from the download
+            # stream so it never touches disk. Decoded audio stays in memory
+            # (about 230 MB per hour) until every download has finished.
+            with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+                if args.keep_audio or np is None:
+                    futures = {i: executor.submit(download_audio, args.urls[i]) for i in pending}
+                else:
+                    futures = {i: executor.submit(decode_audio_stream, args.urls[i]) for i in pending}
+
+            audio_inputs = {}
+            for i, future in futures.items():
+                try:
+                    audio_inputs[i] = future.result()
+                except Exception as e:
+                    print(f"\nError downloading audio for {video_ids[i]}: {e}", file=sys.stderr)
+                    failed += 1
+
+            if args.keep_audio:
+                audio_files.update(audio_inputs)
+
+            pending = []
+            if audio_inputs:
+                indices = list(audio_inputs)
+                inputs = [audio_inputs[i] for i in indices]
+                try:
+                    if len(inputs) == 1:
+                        texts = [transcribe_with_local_whisper(
+                            inputs[0],
                             primary_language,
-                            args.whisper_model
+                            args.whisper_model,
+                            args.compute_type,
+                            args.cpu_threads,
+                            args.keep_model_loaded,
+                            args.compile,
+                            backend=args.backend,
+                            ggml_model=args.ggml_model,
+                            vad=args.vad
+                        )]
+                    else:
+                        texts = transcribe_batch(
+                            inputs,
+                            primary_language,
+                            args.whisper_model,
+                            args.compute_type,
+                            args.cpu_threads,
+                            args.keep_model_loaded,
+                            args.compile,
+                            args.batch_size,
+                            backend=args.backend,
+                            ggml_model=args.ggml_model,
+                            vad=args.vad
                         )
-                        print(f"\nTranscription completed successfully with local Whisper!")
-                    except Exception as whisper_error:
-                        if args.use_local_whisper:
-                            # User explicitly requested local whisper, don't fallback
-                            raise whisper_error
+                    for i, text in zip(indices, texts):
+                        transcripts[i] = text
+                    print(f"\nTranscription completed successfully with local Whisper!")
+                except Exception as whisper_error:
+                    if args.use_local_whisper:
+                        # User explicitly requested local whisper, don't fallback
+                        print(f"\nError during audio transcription: {whisper_error}", file=sys.stderr)
+                        failed += len(indices)
+                    else:
                         print(f"\nLocal Whisper failed: {whisper_error}")
                         print("Falling back to Whishper server...")
-                        # Try Whishper as fallback
-                        transcript_text = transcribe_with_whishper(audio_file, args.whishper_url, primary_language)
-                        print(f"\nTranscription completed successfully with Whishper!")
-                else:
-                    # Use Whishper directly
-                    transcript_text = transcribe_with_whishper(audio_file, args.whishper_url, primary_language)
-                    print(f"\nTranscription completed successfully!")
+                        pending = indices
+
+        if pending:
+            # Upload each file to Whishper as soon as its download finishes, so
+            # uploads and server-side transcription overlap the other downloads
+            with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+                futures = {i: executor.submit(_transcribe_with_whishper, i) for i in pending}
+
+            for i, future in futures.items():
+                try:
+                    transcripts[i] = future.result()
+                    print(f"\nTranscription of {video_ids[i]} completed successfully with Whishper!")
+                except Exception as e:
+                    print(f"\nError during audio transcription of {video_ids[i]}: {e}", file=sys.stderr)
+                    failed += 1
+
+        # Save transcripts
+        for video_id, transcript_text, output_path in zip(video_ids, transcripts, output_paths):
+            if transcript_text is None:
+                continue
 
+            try:
+                save_transcript(transcript_text, output_path)
+                print(f"\nTranscript saved to: {output_path.absolute()}")
             except Exception as e:
-                print(f"\nError during audio transcription: {e}", file=sys.stderr)
-                # Cleanup audio file if exists
-                if audio_file and audio_file.exists() and not args.keep_audio:
-                    audio_file.unlink()
-                sys.exit(1)
-
-        # Determine output path
-        if args.output:
-            output_path = Path(args.output)
-        else:
-            extension = args.format if args.format != 'text' else 'txt'
-            output_path = Path('transcripts') / f"{video_id}.{extension}"
-
-        # Save transcript
-        save_transcript(transcript_text, output_path)
-        print(f"\nTranscript saved to: {output_path.absolute()}")
+                print(f"\nError saving transcript for {video_id}: {e}", file=sys.stderr)
+                failed += 1
 
-        # Cleanup audio file if downloaded and not keeping it
-        if audio_file and audio_file.exists() and not args.keep_audio:
-            print(f"Cleaning up audio file: {audio_file}")
-            audio_file.unlink()
+    finally:
+        # Cleanup audio files if downloaded and not keeping them
+        for audio_file in audio_files.values():
+            if audio_file.exists() and not args.keep_audio:
+                print(f"Cleaning up audio file: {audio_file}")
+                audio_file.unlink()
 
-    except ValueError as e:
-        print(f"\nError: {e}", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"\nError: {e}", file=sys.stderr)
+    if failed:
         sys.exit(1)
 
 